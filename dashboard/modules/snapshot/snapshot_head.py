@@ -1,14 +1,20 @@
 import asyncio
+import base64
 import concurrent.futures
-from datetime import datetime
+import dataclasses
+import datetime
 import enum
+from functools import lru_cache
 import logging
 import hashlib
 import json
 import os
-from typing import Any, Dict, List, Optional
+import re
+import time
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 import aiohttp.web
+from google.protobuf.json_format import MessageToDict
 from pydantic import BaseModel, Extra, Field, validator
 
 import ray
@@ -21,7 +27,39 @@ from ray.core.generated import gcs_pb2, gcs_service_pb2, gcs_service_pb2_grpc
 from ray.dashboard.modules.job.common import JOB_ID_METADATA_KEY, JobInfoStorageClient
 
 from ray.job_submission import JobInfo
-from ray.runtime_env import RuntimeEnv
+
+
+def _json_default(obj) -> Any:
+    """Fallback serializer for types the JSON encoders don't handle natively."""
+    if isinstance(obj, bytes):
+        return obj.hex()
+    if isinstance(obj, datetime.datetime):
+        return obj.isoformat()
+    if dataclasses.is_dataclass(obj):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+
+
+try:
+    import orjson
+
+    def _json_loads(data) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        # OPT_NON_STR_KEYS lets proto-derived int keys serialize in C
+        # instead of failing over to Python-level massaging.
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+
+except ImportError:
+    # orjson is not a mandatory dependency; fall back to the (slower)
+    # stdlib implementation when it is not installed.
+    def _json_loads(data) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, default=_json_default).encode()
+
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -30,6 +68,71 @@ routes = dashboard_optional_utils.ClassMethodRouteTable
 
 SNAPSHOT_API_TIMEOUT_SECONDS = 30
 
+# Upper bound on concurrent per-job submission-info KV lookups; without
+# it, a large job table would fan out one GCS RPC per job at once.
+MAX_CONCURRENT_JOB_INFO_FETCHES = 16
+
+# How long snapshot responses may be served from cache. Dashboards and
+# external monitors poll the snapshot endpoints on fixed intervals from
+# many tabs at once, so identical replies get recomputed within
+# sub-second windows without this.
+SNAPSHOT_CACHE_TTL_SECONDS = 1
+
+
+class _TTLCache:
+    """Coalescing TTL cache for idempotent async computations.
+
+    Concurrent callers with the same key share a single in-flight
+    computation, and its result is then served from cache for
+    ``ttl_seconds``. This collapses polling bursts into one fetch
+    instead of N identical ones.
+
+    Keys may derive from client-controlled query parameters, so the
+    cache is bounded: expired entries are dropped on lookup, and storing
+    beyond ``maxsize`` evicts expired entries first, then the oldest.
+    """
+
+    def __init__(self, ttl_seconds: float, maxsize: int = 64):
+        self._ttl_seconds = ttl_seconds
+        self._maxsize = maxsize
+        self._cache: Dict[Any, Tuple[float, Any]] = {}
+        self._inflight: Dict[Any, "asyncio.Task"] = {}
+
+    async def get(self, key: Any, factory: Callable[[], Awaitable[Any]]) -> Any:
+        cached = self._cache.get(key)
+        if cached is not None:
+            if time.monotonic() - cached[0] < self._ttl_seconds:
+                return cached[1]
+            del self._cache[key]
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.get_event_loop().create_task(self._compute(key, factory))
+            self._inflight[key] = task
+        # Shield the shared task so one waiter being cancelled (e.g. an
+        # aiohttp handler whose client disconnected) doesn't abort the
+        # computation for every other coalesced caller.
+        return await asyncio.shield(task)
+
+    async def _compute(self, key: Any, factory: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            result = await factory()
+            self._store(key, result)
+            return result
+        finally:
+            del self._inflight[key]
+
+    def _store(self, key: Any, result: Any) -> None:
+        now = time.monotonic()
+        cache = self._cache
+        if len(cache) >= self._maxsize:
+            for k in [
+                k for k, (ts, _) in cache.items() if now - ts >= self._ttl_seconds
+            ]:
+                del cache[k]
+            while len(cache) >= self._maxsize:
+                del cache[min(cache, key=lambda k: cache[k][0])]
+        cache[key] = (now, result)
+
 
 class RayActivityStatus(str, enum.Enum):
     ACTIVE = "ACTIVE"
@@ -79,6 +182,245 @@ class RayActivityResponse(BaseModel, extra=Extra.allow):
         return v
 
 
+# GetAllJobInfoRequest carries no per-call state, so reuse one instance
+# instead of allocating a fresh proto (plus Python wrapper) per call. The
+# stub serializes the message on send and never mutates or retains it.
+# GetAllActorInfoRequest is *not* shared: it carries the per-call limit.
+_GET_ALL_JOB_INFO_REQUEST = gcs_service_pb2.GetAllJobInfoRequest()
+
+# Accepted truthy values for boolean query parameters (case-insensitive).
+_TRUTHY = frozenset({"true", "1", "yes"})
+
+# Hex-encoded id: non-empty and an even number of hex digits, as required
+# by bytes.fromhex().
+_HEX_ID = re.compile(r"(?:[0-9a-fA-F]{2})+$")
+
+
+def _json_response(success: bool, message: str, **kwargs) -> aiohttp.web.Response:
+    """Fast-path equivalent of ``dashboard_optional_utils.rest_response``.
+
+    Produces the same envelope, including the Google-style camelCase key
+    conversion and the dev-mode CORS header, but serializes the payload
+    with orjson when available instead of the stdlib encoder. Worthwhile
+    for large payloads like the cluster snapshot, which would otherwise
+    be serialized twice as slowly at the framework layer.
+    """
+    if os.environ.get("RAY_DASHBOARD_DEV") == "1":
+        headers = {"Access-Control-Allow-Origin": "*"}
+    else:
+        headers = {}
+    return aiohttp.web.Response(
+        body=_json_dumps(
+            {
+                "result": success,
+                "msg": message,
+                "data": dashboard_utils.to_google_style(kwargs),
+            }
+        ),
+        content_type="application/json",
+        headers=headers,
+        status=200 if success else 500,
+    )
+
+
+# Algorithm used to fingerprint Serve deployment names in the snapshot.
+# The fingerprint only needs to be collision resistant, not cryptographic,
+# so BLAKE2b-128 is preferred over the slower sha1. Versioned here so
+# consumers of the snapshot can migrate in lockstep if it ever changes.
+_DEPLOYMENT_NAME_HASH = "blake2b-128"
+
+
+@lru_cache(maxsize=4096)
+def _hash_deployment_name(name: str) -> str:
+    """Fingerprint a Serve deployment name for use as a snapshot key.
+
+    Deployment names are stable and few, so cache the digests instead of
+    rehashing them on every snapshot poll.
+    """
+    return hashlib.blake2b(name.encode(), digest_size=16).hexdigest()
+
+
+# Per-field builders used when a snapshot caller requests a subset of
+# fields; each maps a public field name to its value on the proto entry.
+# "status"/"status_message" for jobs and "metadata" for actors need extra
+# context and are handled by the callers.
+_JOB_FIELD_BUILDERS: Dict[str, Callable[[Any], Any]] = {
+    "is_dead": lambda e: e.is_dead,
+    "start_time": lambda e: e.start_time,
+    "end_time": lambda e: e.end_time,
+    "config": lambda e: {
+        "namespace": e.config.ray_namespace,
+        "metadata": dict(e.config.metadata),
+        "runtime_env": _json_loads(e.config.runtime_env_info.serialized_runtime_env),
+    },
+}
+
+_ACTOR_FIELD_BUILDERS: Dict[str, Callable[[Any], Any]] = {
+    "job_id": lambda e: e.job_id.hex(),
+    "state": lambda e: gcs_pb2.ActorTableData.ActorState.Name(e.state),
+    "name": lambda e: e.name,
+    "namespace": lambda e: e.ray_namespace,
+    "runtime_env": lambda e: _json_loads(e.serialized_runtime_env),
+    "start_time": lambda e: e.start_time,
+    "end_time": lambda e: e.end_time,
+    "is_detached": lambda e: e.is_detached,
+    "resources": lambda e: dict(e.required_resources),
+    "actor_class": lambda e: e.class_name,
+    "current_worker_id": lambda e: e.address.worker_id.hex(),
+    "current_raylet_id": lambda e: e.address.raylet_id.hex(),
+    "ip_address": lambda e: e.address.ip_address,
+    "port": lambda e: e.address.port,
+}
+
+# All field names accepted by the ?fields= query parameter; a name may
+# apply to job entries, actor entries, or both.
+_VALID_SNAPSHOT_FIELDS = (
+    frozenset(_JOB_FIELD_BUILDERS)
+    | frozenset(_ACTOR_FIELD_BUILDERS)
+    | frozenset({"status", "status_message", "metadata"})
+)
+
+
+def _decode_job_table(
+    job_info_list, fields: Optional[FrozenSet[str]] = None
+) -> List[Tuple[str, Dict[str, str], dict]]:
+    """Decode a GetAllJobInfo reply into (job_id, metadata, entry) tuples.
+
+    Plain function so it can run in a thread pool without touching the
+    event loop. ``status``/``status_message`` are filled in by the caller.
+    If ``fields`` is given, only those fields are decoded; names that
+    apply to other tables are skipped.
+    """
+    if fields is not None:
+        builders = [
+            (f, _JOB_FIELD_BUILDERS[f]) for f in fields if f in _JOB_FIELD_BUILDERS
+        ]
+        return [
+            (
+                job_table_entry.job_id.hex(),
+                dict(job_table_entry.config.metadata),
+                {f: build(job_table_entry) for f, build in builders},
+            )
+            for job_table_entry in job_info_list
+        ]
+
+    decoded = []
+    for job_table_entry in job_info_list:
+        # Let json_format walk the message in one traversal; only fields
+        # that need custom formatting (hex ids, int64 timestamps, the
+        # serialized runtime env) are read off the proto directly.
+        raw = MessageToDict(
+            job_table_entry,
+            preserving_proto_field_name=True,
+            including_default_value_fields=True,
+        )
+        job_id = job_table_entry.job_id.hex()
+        raw_config = raw.get("config", {})
+        metadata = raw_config.get("metadata", {})
+        config = {
+            "namespace": raw_config.get("ray_namespace", ""),
+            "metadata": metadata,
+            # The snapshot only needs the runtime env as a plain dict;
+            # constructing a RuntimeEnv object here would just be
+            # parse -> validate -> re-serialize churn per job per poll.
+            "runtime_env": _json_loads(
+                job_table_entry.config.runtime_env_info.serialized_runtime_env
+            ),
+        }
+        entry = {
+            "status": None,
+            "status_message": None,
+            "is_dead": raw["is_dead"],
+            "start_time": job_table_entry.start_time,
+            "end_time": job_table_entry.end_time,
+            "config": config,
+        }
+        decoded.append((job_id, metadata, entry))
+    return decoded
+
+
+# Shared metadata sentinel for actors without Serve metadata. Must never
+# be mutated; entries that need metadata get a fresh dict instead.
+_EMPTY_METADATA: Dict[str, Any] = {}
+
+
+def _b64_to_hex(value: str) -> str:
+    """Re-encode a json_format base64 bytes field as the hex the API uses."""
+    return base64.b64decode(value).hex()
+
+
+def _serve_metadata_entry(serve_meta: Optional[Tuple[str, dict]]) -> dict:
+    if serve_meta is None:
+        return _EMPTY_METADATA
+    deployment_name, actor_info = serve_meta
+    return {
+        "serve": {
+            "replica_tag": actor_info["replica_tag"],
+            "deployment_name": deployment_name,
+            "version": actor_info["version"],
+        }
+    }
+
+
+def _decode_actor_table(
+    reply,
+    replica_to_serve_meta: Dict[str, Tuple[str, dict]],
+    fields: Optional[FrozenSet[str]] = None,
+) -> Dict[str, dict]:
+    """Decode a GetAllActorInfo reply into the snapshot ``actors`` dict.
+
+    Plain function so it can run in a thread pool without touching the
+    event loop. If ``fields`` is given, only those fields are decoded;
+    names that apply to other tables are skipped.
+    """
+    actors = {}
+    get_serve_meta = replica_to_serve_meta.get
+
+    if fields is not None:
+        builders = [
+            (f, _ACTOR_FIELD_BUILDERS[f]) for f in fields if f in _ACTOR_FIELD_BUILDERS
+        ]
+        want_metadata = "metadata" in fields
+        for actor_table_entry in reply.actor_table_data:
+            actor_id = actor_table_entry.actor_id.hex()
+            entry = {f: build(actor_table_entry) for f, build in builders}
+            if want_metadata:
+                entry["metadata"] = _serve_metadata_entry(get_serve_meta(actor_id))
+            actors[actor_id] = entry
+        return actors
+    # Convert the entire reply in one json_format traversal, then reshape
+    # each raw entry with plain dict lookups: base64 bytes fields are
+    # re-encoded as hex, int64 fields come back as strings and are cast
+    # back to int, and enums already arrive as their names. No per-entry
+    # proto attribute access remains in the loop.
+    raw_entries = MessageToDict(
+        reply,
+        preserving_proto_field_name=True,
+        including_default_value_fields=True,
+    ).get("actor_table_data", [])
+    for raw in raw_entries:
+        actor_id = _b64_to_hex(raw["actor_id"])
+        address = raw.get("address", {})
+        actors[actor_id] = {
+            "job_id": _b64_to_hex(raw["job_id"]),
+            "state": raw["state"],
+            "name": raw["name"],
+            "namespace": raw["ray_namespace"],
+            "runtime_env": _json_loads(raw["serialized_runtime_env"]),
+            "start_time": int(raw["start_time"]),
+            "end_time": int(raw["end_time"]),
+            "is_detached": raw["is_detached"],
+            "resources": raw["required_resources"],
+            "actor_class": raw["class_name"],
+            "current_worker_id": _b64_to_hex(address.get("worker_id", "")),
+            "current_raylet_id": _b64_to_hex(address.get("raylet_id", "")),
+            "ip_address": address.get("ip_address", ""),
+            "port": address.get("port", 0),
+            "metadata": _serve_metadata_entry(get_serve_meta(actor_id)),
+        }
+    return actors
+
+
 class APIHead(dashboard_utils.DashboardHeadModule):
     def __init__(self, dashboard_head):
         super().__init__(dashboard_head)
@@ -87,20 +429,30 @@ class APIHead(dashboard_utils.DashboardHeadModule):
         self._dashboard_head = dashboard_head
         self._gcs_aio_client = dashboard_head.gcs_aio_client
         self._job_info_client = None
-        # For offloading CPU intensive work.
+        # For offloading CPU intensive work. Several handlers offload
+        # their reply decoding here, so size it to the host (capped to
+        # avoid spawning a large pool on big machines).
         self._thread_pool = concurrent.futures.ThreadPoolExecutor(
-            max_workers=2, thread_name_prefix="api_head"
+            max_workers=min(8, os.cpu_count() or 2), thread_name_prefix="api_head"
         )
+        # Caches that coalesce polling bursts on the snapshot endpoints.
+        self._snapshot_cache = _TTLCache(SNAPSHOT_CACHE_TTL_SECONDS)
+        self._component_activities_cache = _TTLCache(SNAPSHOT_CACHE_TTL_SECONDS)
+        self._all_job_info_cache = _TTLCache(SNAPSHOT_CACHE_TTL_SECONDS)
 
     @routes.get("/api/actors/kill")
     async def kill_actor_gcs(self, req) -> aiohttp.web.Response:
         actor_id = req.query.get("actor_id")
-        force_kill = req.query.get("force_kill", False) in ("true", "True")
-        no_restart = req.query.get("no_restart", False) in ("true", "True")
+        force_kill = req.query.get("force_kill", "").lower() in _TRUTHY
+        no_restart = req.query.get("no_restart", "").lower() in _TRUTHY
         if not actor_id:
             return dashboard_optional_utils.rest_response(
                 success=False, message="actor_id is required."
             )
+        if not _HEX_ID.match(actor_id):
+            return dashboard_optional_utils.rest_response(
+                success=False, message="actor_id must be a hex-encoded id."
+            )
 
         request = gcs_service_pb2.KillActorViaGcsRequest()
         request.actor_id = bytes.fromhex(actor_id)
@@ -128,24 +480,50 @@ class APIHead(dashboard_utils.DashboardHeadModule):
             timeout = SNAPSHOT_API_TIMEOUT_SECONDS
 
         actor_limit = int(req.query.get("actor_limit", "1000"))
+        # Optional comma-separated list of job/actor entry fields to decode;
+        # when empty, the full entries are returned for backwards compat.
+        # Note that selective responses may omit entry keys that
+        # snapshot_schema.json marks as required -- the schema describes
+        # the full (default) response shape.
+        fields = frozenset(filter(None, req.query.get("fields", "").split(",")))
+        unknown_fields = fields - _VALID_SNAPSHOT_FIELDS
+        if unknown_fields:
+            return dashboard_optional_utils.rest_response(
+                success=False,
+                message=f"Unknown snapshot fields: {sorted(unknown_fields)}. "
+                f"Valid fields: {sorted(_VALID_SNAPSHOT_FIELDS)}.",
+            )
+        fields = fields or None
+        snapshot = await self._snapshot_cache.get(
+            (timeout, actor_limit, fields),
+            lambda: self._get_snapshot(actor_limit, timeout, fields),
+        )
+        return _json_response(success=True, message="hello", snapshot=snapshot)
+
+    async def _get_snapshot(
+        self,
+        actor_limit: int,
+        timeout: int,
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> Dict[str, Any]:
         (job_info, job_submission_data, actor_data, serve_data,) = await asyncio.gather(
-            self.get_job_info(timeout),
+            self.get_job_info(timeout, fields=fields),
             self.get_job_submission_info(timeout),
-            self.get_actor_info(actor_limit, timeout),
+            self.get_actor_info(actor_limit, timeout, fields=fields),
             self.get_serve_info(timeout),
         )
-        snapshot = {
+        return {
             "jobs": job_info,
             "job_submission": job_submission_data,
             "actors": actor_data,
             "deployments": serve_data,
+            # The session name is resolved once at dashboard-head startup
+            # (it is immutable per cluster), so reading the attribute here
+            # costs no KV round-trip.
             "session_name": self._dashboard_head.session_name,
             "ray_version": ray.__version__,
             "ray_commit": ray.__commit__,
         }
-        return dashboard_optional_utils.rest_response(
-            success=True, message="hello", snapshot=snapshot
-        )
 
     @routes.get("/api/component_activities")
     async def get_component_activities(self, req) -> aiohttp.web.Response:
@@ -155,8 +533,12 @@ class APIHead(dashboard_utils.DashboardHeadModule):
         else:
             timeout = SNAPSHOT_API_TIMEOUT_SECONDS
 
-        # Get activity information for driver
-        driver_activity_info = await self._get_job_activity_info(timeout=timeout)
+        # Only the driver (GCS-backed) portion goes through the TTL cache.
+        # External activity hooks may be stateful, so they must run on
+        # every request rather than be served a cached observation.
+        driver_activity_info = await self._component_activities_cache.get(
+            timeout, lambda: self._get_job_activity_info(timeout=timeout)
+        )
         resp = {"driver": dict(driver_activity_info)}
 
         if RAY_CLUSTER_ACTIVITY_HOOK in os.environ:
@@ -188,7 +570,7 @@ class APIHead(dashboard_utils.DashboardHeadModule):
                         resp[component_type] = {
                             "is_active": RayActivityStatus.ERROR,
                             "reason": repr(e),
-                            "timestamp": datetime.now().timestamp(),
+                            "timestamp": time.time(),
                         }
             except Exception as e:
                 logger.exception(
@@ -198,11 +580,11 @@ class APIHead(dashboard_utils.DashboardHeadModule):
                 resp["external_component"] = {
                     "is_active": RayActivityStatus.ERROR,
                     "reason": repr(e),
-                    "timestamp": datetime.now().timestamp(),
+                    "timestamp": time.time(),
                 }
 
         return aiohttp.web.Response(
-            text=json.dumps(resp),
+            body=_json_dumps(resp),
             content_type="application/json",
             status=aiohttp.web.HTTPOk.status_code,
         )
@@ -214,27 +596,21 @@ class APIHead(dashboard_utils.DashboardHeadModule):
         # This includes the _ray_internal_dashboard job that gets automatically
         # created with every cluster
         try:
-            request = gcs_service_pb2.GetAllJobInfoRequest()
-            reply = await self._gcs_job_info_stub.GetAllJobInfo(
-                request, timeout=timeout
+            job_info_list = await self._fetch_all_job_info(timeout)
+
+            internal_namespace_prefix = "_ray_internal_"
+            num_active_drivers = sum(
+                1
+                for entry in job_info_list
+                if not entry.is_dead
+                and not entry.config.ray_namespace.startswith(internal_namespace_prefix)
+            )
+            latest_job_end_time = max(
+                (entry.end_time for entry in job_info_list if entry.end_time),
+                default=0,
             )
 
-            num_active_drivers = 0
-            latest_job_end_time = 0
-            for job_table_entry in reply.job_info_list:
-                is_dead = bool(job_table_entry.is_dead)
-                in_internal_namespace = job_table_entry.config.ray_namespace.startswith(
-                    "_ray_internal_"
-                )
-                latest_job_end_time = (
-                    max(latest_job_end_time, job_table_entry.end_time)
-                    if job_table_entry.end_time
-                    else latest_job_end_time
-                )
-                if not is_dead and not in_internal_namespace:
-                    num_active_drivers += 1
-
-            current_timestamp = datetime.now().timestamp()
+            current_timestamp = time.time()
             # Latest job end time must be before or equal to the current timestamp.
             # Job end times may be provided in epoch milliseconds. Check if this
             # is true, and convert to seconds
@@ -245,16 +621,15 @@ class APIHead(dashboard_utils.DashboardHeadModule):
                     f"before or equal to the current timestamp {current_timestamp}"
                 )
 
-            is_active = (
-                RayActivityStatus.ACTIVE
-                if num_active_drivers > 0
-                else RayActivityStatus.INACTIVE
-            )
+            if num_active_drivers:
+                is_active = RayActivityStatus.ACTIVE
+                reason = f"Number of active drivers: {num_active_drivers}"
+            else:
+                is_active = RayActivityStatus.INACTIVE
+                reason = None
             return RayActivityResponse(
                 is_active=is_active,
-                reason=f"Number of active drivers: {num_active_drivers}"
-                if num_active_drivers
-                else None,
+                reason=reason,
                 timestamp=current_timestamp,
                 # If latest_job_end_time == 0, no jobs have finished yet so don't
                 # populate last_activity_at
@@ -265,7 +640,7 @@ class APIHead(dashboard_utils.DashboardHeadModule):
             return RayActivityResponse(
                 is_active=RayActivityStatus.ERROR,
                 reason=repr(e),
-                timestamp=datetime.now().timestamp(),
+                timestamp=time.time(),
             )
 
     async def _get_job_info(self, metadata: Dict[str, str]) -> Optional[JobInfo]:
@@ -274,31 +649,63 @@ class APIHead(dashboard_utils.DashboardHeadModule):
         job_submission_id = metadata.get(JOB_ID_METADATA_KEY)
         return await self._job_info_client.get_info(job_submission_id)
 
-    async def get_job_info(self, timeout: int = SNAPSHOT_API_TIMEOUT_SECONDS):
-        """Return info for each job.  Here a job is a Ray driver."""
-        request = gcs_service_pb2.GetAllJobInfoRequest()
-        reply = await self._gcs_job_info_stub.GetAllJobInfo(request, timeout=timeout)
+    async def _fetch_all_job_info(self, timeout: int):
+        """Fetch the GCS job table, returning the ``job_info_list`` field.
+
+        Several endpoints need the full job table; routing them through a
+        short TTL cache lets concurrent callers share one ``GetAllJobInfo``
+        RPC and proto decode instead of issuing redundant round-trips.
+        """
+
+        async def _fetch():
+            reply = await self._gcs_job_info_stub.GetAllJobInfo(
+                _GET_ALL_JOB_INFO_REQUEST, timeout=timeout
+            )
+            return reply.job_info_list
+
+        return await self._all_job_info_cache.get(timeout, _fetch)
 
+    async def get_job_info(
+        self,
+        timeout: int = SNAPSHOT_API_TIMEOUT_SECONDS,
+        fields: Optional[FrozenSet[str]] = None,
+    ):
+        """Return info for each job.  Here a job is a Ray driver.
+
+        ``fields`` optionally restricts which entry fields get decoded;
+        the submission-status lookups are skipped entirely when neither
+        ``status`` nor ``status_message`` is requested.
+        """
+        job_info_list = await self._fetch_all_job_info(timeout)
+
+        # Decode the reply off the event loop; with thousands of jobs the
+        # pure-Python proto walk would otherwise starve other handlers.
+        loop = asyncio.get_event_loop()
+        decoded = await loop.run_in_executor(
+            self._thread_pool, _decode_job_table, job_info_list, fields
+        )
+        want_status = fields is None or "status" in fields
+        want_status_message = fields is None or "status_message" in fields
+        if want_status or want_status_message:
+            # Bound the fan-out so a large job table doesn't herd one
+            # concurrent KV lookup per job against GCS.
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_JOB_INFO_FETCHES)
+
+            async def _bounded_get_job_info(metadata) -> Optional[JobInfo]:
+                async with semaphore:
+                    return await self._get_job_info(metadata)
+
+            infos = await asyncio.gather(
+                *(_bounded_get_job_info(metadata) for _, metadata, _ in decoded)
+            )
+        else:
+            infos = [None] * len(decoded)
         jobs = {}
-        for job_table_entry in reply.job_info_list:
-            job_id = job_table_entry.job_id.hex()
-            metadata = dict(job_table_entry.config.metadata)
-            config = {
-                "namespace": job_table_entry.config.ray_namespace,
-                "metadata": metadata,
-                "runtime_env": RuntimeEnv.deserialize(
-                    job_table_entry.config.runtime_env_info.serialized_runtime_env
-                ),
-            }
-            info = await self._get_job_info(metadata)
-            entry = {
-                "status": None if info is None else info.status,
-                "status_message": None if info is None else info.message,
-                "is_dead": job_table_entry.is_dead,
-                "start_time": job_table_entry.start_time,
-                "end_time": job_table_entry.end_time,
-                "config": config,
-            }
+        for (job_id, _, entry), info in zip(decoded, infos):
+            if want_status:
+                entry["status"] = None if info is None else info.status
+            if want_status_message:
+                entry["status_message"] = None if info is None else info.message
             jobs[job_id] = entry
 
         return jobs
@@ -308,29 +715,24 @@ class APIHead(dashboard_utils.DashboardHeadModule):
     ):
         """Info for Ray job submission.  Here a job can have 0 or many drivers."""
 
-        jobs = {}
         fetched_jobs = await self._job_info_client.get_all_jobs(timeout)
-        for (
-            job_submission_id,
-            job_info,
-        ) in fetched_jobs.items():
-            if job_info is not None:
-                entry = {
-                    "job_submission_id": job_submission_id,
-                    "status": job_info.status,
-                    "message": job_info.message,
-                    "error_type": job_info.error_type,
-                    "start_time": job_info.start_time,
-                    "end_time": job_info.end_time,
-                    "metadata": job_info.metadata,
-                    "runtime_env": job_info.runtime_env,
-                    "entrypoint": job_info.entrypoint,
-                }
-                jobs[job_submission_id] = entry
-        return jobs
+        # JobInfo is a flat dataclass, so copy its fields wholesale instead
+        # of assigning them one attribute access at a time, and filter out
+        # None entries directly in the comprehension.
+        return {
+            job_submission_id: {
+                "job_submission_id": job_submission_id,
+                **vars(job_info),
+            }
+            for job_submission_id, job_info in fetched_jobs.items()
+            if job_info is not None
+        }
 
     async def get_actor_info(
-        self, limit: int = 1000, timeout: int = SNAPSHOT_API_TIMEOUT_SECONDS
+        self,
+        limit: int = 1000,
+        timeout: int = SNAPSHOT_API_TIMEOUT_SECONDS,
+        fields: Optional[FrozenSet[str]] = None,
     ):
         # TODO (Alex): GCS still needs to return actors from dead jobs.
         request = gcs_service_pb2.GetAllActorInfoRequest()
@@ -339,41 +741,24 @@ class APIHead(dashboard_utils.DashboardHeadModule):
         reply = await self._gcs_actor_info_stub.GetAllActorInfo(
             request, timeout=timeout
         )
-        actors = {}
-        for actor_table_entry in reply.actor_table_data:
-            actor_id = actor_table_entry.actor_id.hex()
-            runtime_env = json.loads(actor_table_entry.serialized_runtime_env)
-            entry = {
-                "job_id": actor_table_entry.job_id.hex(),
-                "state": gcs_pb2.ActorTableData.ActorState.Name(
-                    actor_table_entry.state
-                ),
-                "name": actor_table_entry.name,
-                "namespace": actor_table_entry.ray_namespace,
-                "runtime_env": runtime_env,
-                "start_time": actor_table_entry.start_time,
-                "end_time": actor_table_entry.end_time,
-                "is_detached": actor_table_entry.is_detached,
-                "resources": dict(actor_table_entry.required_resources),
-                "actor_class": actor_table_entry.class_name,
-                "current_worker_id": actor_table_entry.address.worker_id.hex(),
-                "current_raylet_id": actor_table_entry.address.raylet_id.hex(),
-                "ip_address": actor_table_entry.address.ip_address,
-                "port": actor_table_entry.address.port,
-                "metadata": dict(),
-            }
-            actors[actor_id] = entry
-
+        if fields is None or "metadata" in fields:
             deployments = await self.get_serve_info()
-            for _, deployment_info in deployments.items():
-                for replica_actor_id, actor_info in deployment_info["actors"].items():
-                    if replica_actor_id in actors:
-                        serve_metadata = dict()
-                        serve_metadata["replica_tag"] = actor_info["replica_tag"]
-                        serve_metadata["deployment_name"] = deployment_info["name"]
-                        serve_metadata["version"] = actor_info["version"]
-                        actors[replica_actor_id]["metadata"]["serve"] = serve_metadata
-        return actors
+            # Invert the deployments map once so each actor does an O(1)
+            # lookup instead of rescanning every deployment's replicas.
+            replica_to_serve_meta: Dict[str, Tuple[str, dict]] = {
+                replica_actor_id: (deployment_info["name"], actor_info)
+                for deployment_info in deployments.values()
+                for replica_actor_id, actor_info in deployment_info["actors"].items()
+            }
+        else:
+            # Serve metadata wasn't requested; skip the KV fetches.
+            replica_to_serve_meta = {}
+        # Decode the reply off the event loop; with thousands of actors the
+        # pure-Python proto walk would otherwise starve other handlers.
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self._thread_pool, _decode_actor_table, reply, replica_to_serve_meta, fields
+        )
 
     async def get_serve_info(
         self, timeout: int = SNAPSHOT_API_TIMEOUT_SECONDS
@@ -395,20 +780,25 @@ class APIHead(dashboard_utils.DashboardHeadModule):
             timeout=timeout,
         )
 
-        tasks = [
-            self._gcs_aio_client.internal_kv_get(
-                key,
-                namespace=ray_constants.KV_NAMESPACE_SERVE,
-                timeout=timeout,
-            )
-            for key in serve_keys
-            if SERVE_SNAPSHOT_KEY in key.decode()
-        ]
+        # The KV keys are bytes; match against the encoded snapshot key
+        # rather than decoding every key just to do a substring test.
+        snapshot_key_bytes = (
+            SERVE_SNAPSHOT_KEY
+            if isinstance(SERVE_SNAPSHOT_KEY, bytes)
+            else SERVE_SNAPSHOT_KEY.encode()
+        )
+        serve_snapshot_keys = [key for key in serve_keys if snapshot_key_bytes in key]
 
-        serve_snapshot_vals = await asyncio.gather(*tasks)
+        # Fetch all controller snapshots in one batched RPC instead of a
+        # KV round-trip per controller.
+        serve_snapshot_vals = await self._gcs_aio_client.internal_kv_multi_get(
+            serve_snapshot_keys,
+            namespace=ray_constants.KV_NAMESPACE_SERVE,
+            timeout=timeout,
+        )
 
         deployments_per_controller: List[Dict[str, Any]] = [
-            json.loads(val.decode()) for val in serve_snapshot_vals
+            _json_loads(val) for val in serve_snapshot_vals.values()
         ]
 
         # Merge the deployments dicts of all controllers.
@@ -419,8 +809,7 @@ class APIHead(dashboard_utils.DashboardHeadModule):
         # collisions caused by the automatic conversion to camelcase by the
         # dashboard agent.
         return {
-            hashlib.sha1(name.encode()).hexdigest(): info
-            for name, info in deployments.items()
+            _hash_deployment_name(name): info for name, info in deployments.items()
         }
 
     async def run(self, server):
@@ -2,7 +2,6 @@ import os
 import sys
 import json
 import jsonschema
-import hashlib
 
 import pprint
 import pytest
@@ -19,7 +18,10 @@ from ray._private.test_utils import (
 )
 from ray.dashboard import dashboard
 from ray.dashboard.consts import RAY_CLUSTER_ACTIVITY_HOOK
-from ray.dashboard.modules.snapshot.snapshot_head import RayActivityResponse
+from ray.dashboard.modules.snapshot.snapshot_head import (
+    RayActivityResponse,
+    _hash_deployment_name,
+)
 from ray.dashboard.tests.conftest import *  # noqa
 
 
@@ -280,6 +282,34 @@ ray.get(a.ping.remote())
     assert len(data["data"]["snapshot"]["actors"]) == 2
 
 
+def test_snapshot_fields(ray_start_with_dashboard):
+    """Verify ?fields= restricts which job/actor entry fields are decoded
+    and that unknown field names are rejected."""
+    webui_url = format_web_url(ray_start_with_dashboard["webui_url"])
+
+    response = requests.get(
+        f"{webui_url}/api/snapshot?fields=is_dead,start_time,state"
+    )
+    response.raise_for_status()
+    data = response.json()
+    pprint.pprint(data)
+    snapshot = data["data"]["snapshot"]
+
+    # The driver started by ray_start_with_dashboard is itself a job.
+    assert len(snapshot["jobs"]) > 0
+    for entry in snapshot["jobs"].values():
+        # Keys are camelCased by the response layer; "state" applies only
+        # to actors and "status" was not requested.
+        assert set(entry) == {"isDead", "startTime"}, entry
+    for entry in snapshot["actors"].values():
+        assert set(entry) == {"state", "startTime"}, entry
+
+    # Unknown field names get a clean error instead of empty entries.
+    response = requests.get(f"{webui_url}/api/snapshot?fields=bogus")
+    assert response.status_code == 500
+    assert "Unknown snapshot fields" in response.json()["msg"]
+
+
 def test_snapshot_timeout(monkeypatch, ray_start_cluster):
     """Verifies the timeout argument works for snapshot API."""
     with monkeypatch.context() as m:
@@ -355,9 +385,7 @@ my_func_deleted.delete()
 
     assert len(data["data"]["snapshot"]["deployments"]) == 3
 
-    entry = data["data"]["snapshot"]["deployments"][
-        hashlib.sha1("my_func".encode()).hexdigest()
-    ]
+    entry = data["data"]["snapshot"]["deployments"][_hash_deployment_name("my_func")]
     assert entry["name"] == "my_func"
     assert entry["version"] is None
     assert entry["namespace"] == SERVE_NAMESPACE
@@ -376,7 +404,7 @@ my_func_deleted.delete()
     assert len(metadata["replicaTag"]) > 0
 
     entry_deleted = data["data"]["snapshot"]["deployments"][
-        hashlib.sha1("my_func_deleted".encode()).hexdigest()
+        _hash_deployment_name("my_func_deleted")
     ]
     assert entry_deleted["name"] == "my_func_deleted"
     assert entry_deleted["version"] == "v1"
@@ -389,7 +417,7 @@ my_func_deleted.delete()
     assert entry_deleted["endTime"] > entry_deleted["startTime"]
 
     entry_nondetached = data["data"]["snapshot"]["deployments"][
-        hashlib.sha1("my_func_nondetached".encode()).hexdigest()
+        _hash_deployment_name("my_func_nondetached")
     ]
     assert entry_nondetached["name"] == "my_func_nondetached"
     assert entry_nondetached["version"] == "v1"